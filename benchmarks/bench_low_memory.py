@@ -0,0 +1,158 @@
+#############################################################
+####  Peak-RSS benchmark: standard vs low-memory processing.
+#############################################################
+# Generates synthetic text PDFs of increasing page counts and runs the
+# extract -> chunk -> process -> write pipeline in a fresh subprocess per
+# (mode, size), reporting peak RSS. The LLM call is replaced by a local
+# function returning half of each chunk, so no API key is needed.
+#
+#     python benchmarks/bench_low_memory.py [--pages 100 500 1500] [--page-kb 100]
+import os
+import sys
+import argparse
+import resource
+import tempfile
+import subprocess
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+LINES_PER_PAGE = 45
+PAGES_PER_NODE = 20
+WORDS = ("analysis", "theory", "model", "student", "concept", "evidence", "method",
+         "structure", "process", "learning", "memory", "example", "result", "system")
+
+
+def make_pdf(path: str, pages: int, page_kb: int = 100) -> None:
+    # Write a text-native PDF shaped like a real one: a balanced page tree
+    # (MediaBox inherited from the intermediate nodes), a Helvetica text block
+    # and a page_kb image XObject on every page. Objects are written as they
+    # are built so the generator itself stays small.
+    side = max(1, int((page_kb * 1024) ** 0.5))
+    offsets = {}
+    next_id = [4]  # 1 catalog, 2 page tree root, 3 font
+
+    def new_id() -> int:
+        next_id[0] += 1
+        return next_id[0] - 1
+
+    with open(path, "wb") as f:
+        def write(obj_id: int, obj: bytes) -> None:
+            offsets[obj_id] = f.tell()
+            f.write(b"%d 0 obj\n" % obj_id + obj + b"\nendobj\n")
+
+        f.write(b"%PDF-1.4\n")
+        write(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        write(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+        groups = []
+        for start in range(0, pages, PAGES_PER_NODE):
+            node_id = new_id()
+            kids = []
+            for p in range(start, min(start + PAGES_PER_NODE, pages)):
+                lines = []
+                for l in range(LINES_PER_PAGE):
+                    words = " ".join(WORDS[(p * 7 + l * 3 + w) % len(WORDS)] for w in range(12))
+                    lines.append(f"({words} {p}.{l}.) Tj T*")
+                    if l % 9 == 8:
+                        lines.append("T*")  # blank line -> paragraph break
+                text = ("BT /F1 10 Tf 12 TL 40 800 Td " + " ".join(lines) + " ET q 100 0 0 100 400 40 cm /Im1 Do Q").encode("latin-1")
+                content_id = new_id()
+                write(content_id, b"<< /Length %d >>\nstream\n" % len(text) + text + b"\nendstream")
+
+                pixels = os.urandom(side * side)
+                image_id = new_id()
+                write(image_id,
+                      b"<< /Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace /DeviceGray "
+                      b"/BitsPerComponent 8 /Length %d >>\nstream\n" % (side, side, len(pixels)) + pixels + b"\nendstream")
+
+                page_id = new_id()
+                write(page_id,
+                      b"<< /Type /Page /Parent %d 0 R /Resources << /Font << /F1 3 0 R >> /XObject << /Im1 %d 0 R >> >> "
+                      b"/Contents %d 0 R >>" % (node_id, image_id, content_id))
+                kids.append(page_id)
+
+            write(node_id, b"<< /Type /Pages /Parent 2 0 R /MediaBox [0 0 595 842] /Kids [%s] /Count %d >>" % (
+                b" ".join(b"%d 0 R" % k for k in kids), len(kids)
+            ))
+            groups.append(node_id)
+        write(2, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(b"%d 0 R" % g for g in groups), pages))
+
+        xref = f.tell()
+        size = next_id[0]
+        f.write(b"xref\n0 %d\n0000000000 65535 f \n" % size)
+        for obj_id in range(1, size):
+            f.write(b"%010d 00000 n \n" % offsets[obj_id])
+        f.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref))
+
+
+def peak_rss_kib() -> int:
+    # Peak RSS of this process. VmHWM is reset by exec; ru_maxrss on Linux
+    # can carry over the parent's peak, so prefer /proc when available.
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def fake_llm(chunk: str, chunk_num: int):
+    output = chunk[:len(chunk) // 2]
+    return output, len(output) // 4
+
+
+def run_pipeline(mode: str, pdf_path: str, output_dir: str) -> None:
+    from core.chunked_processor import TextChunker
+    from core.markdown_writer import MarkdownWriter
+    from core.pdf_loader import extract_text_from_pdf, extract_pages_to_store
+
+    writer = MarkdownWriter(output_dir)
+    if mode == "standard":
+        text = extract_text_from_pdf(pdf_path)
+        content, _ = TextChunker.process_serial(text, fake_llm, show_progress=False)
+        writer.save_file("bench_standard", content)
+    else:
+        store = extract_pages_to_store(pdf_path)
+        with writer.open_stream("bench_low_memory") as (_, f):
+            TextChunker.process_stream(store.iter_chunks(), fake_llm, f.write, show_progress=False)
+        store.close()
+
+    print(peak_rss_kib())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, nargs="+", default=[100, 500, 1500])
+    parser.add_argument("--page-kb", type=int, default=100, help="image payload per page (real PDFs: ~50-200 KB)")
+    parser.add_argument("--run", nargs=3, metavar=("MODE", "PDF", "OUTDIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        run_pipeline(*args.run)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'pages':>6} {'PDF MiB':>8} {'standard MiB':>13} {'low-memory MiB':>15}")
+        for pages in args.pages:
+            pdf_path = os.path.join(tmp, f"doc_{pages}.pdf")
+            make_pdf(pdf_path, pages, args.page_kb)
+            size = os.path.getsize(pdf_path) / 2 ** 20
+
+            peaks = []
+            for mode in ("standard", "low-memory"):
+                out = subprocess.run(
+                    [sys.executable, __file__, "--run", mode, pdf_path, tmp],
+                    check=True, capture_output=True, text=True
+                ).stdout
+                peaks.append(int(out.strip().splitlines()[-1]) / 1024)
+
+            print(f"{pages:>6} {size:>8.1f} {peaks[0]:>13.1f} {peaks[1]:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
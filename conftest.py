@@ -0,0 +1 @@
+# Makes the repository root importable (core/, prompts/) when running pytest.
@@ -0,0 +1,91 @@
+#############################################################
+####     Persistent per-call latency and output-size history.
+#############################################################
+import os
+import json
+import tempfile
+from typing import Any, Dict, Optional
+
+from core.json_utils import to_json
+
+DEFAULT_HISTORY_PATH = "app/call_history.json"
+
+
+class CallHistory:
+    # Records input/output tokens and latency of every LLM call, keyed by
+    # model and output type, so estimates can use real measurements.
+
+    MAX_SAMPLES = 200
+
+    def __init__(self, path: Optional[str] = None):
+        # Args:
+        #     path: JSON file to persist samples to (CALL_HISTORY_PATH env or default).
+
+        self.path = path or os.getenv("CALL_HISTORY_PATH", DEFAULT_HISTORY_PATH)
+        self.samples: Dict[str, list] = {}
+
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self.samples = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Failed to load call history {self.path}: {e}")
+                self.samples = {}
+
+    @staticmethod
+    def _key(model: str, kind: str) -> str:
+        return f"{model}:{kind}"
+
+    def record(self, model: str, kind: str, input_tokens: int, output_tokens: int, latency: float) -> None:
+        # Append one call sample and persist the history.
+        # Args:
+        #     model: Model name used for the call.
+        #     kind: Output type ("notes", "schema", "assessment").
+        #     input_tokens: Estimated prompt tokens.
+        #     output_tokens: Completion tokens reported by the API.
+        #     latency: Wall time of the call in seconds.
+
+        samples = self.samples.setdefault(self._key(model, kind), [])
+        samples.append({
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "latency": round(latency, 3)
+        })
+        del samples[:-self.MAX_SAMPLES]
+        self.save()
+
+    def save(self) -> None:
+        # Write to a temp file next to the history and swap it in, so a crash
+        # mid-write never leaves a truncated file behind.
+        directory = os.path.dirname(self.path) or "."
+        tmp_path = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=".call_history_", suffix=".tmp", dir=directory)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(to_json(self.samples))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Failed to save call history {self.path}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def summary(self, model: str, kind: str) -> Optional[Dict[str, Any]]:
+        # Aggregate statistics for a model/output type.
+        # Returns:
+        #     Dict with calls, output_ratio, seconds_per_output_token,
+        #     or None if no usable samples exist.
+
+        samples = self.samples.get(self._key(model, kind), [])
+        total_in = sum(s["input_tokens"] for s in samples)
+        total_out = sum(s["output_tokens"] for s in samples)
+        total_latency = sum(s["latency"] for s in samples)
+
+        if not samples or not total_in or not total_out:
+            return None
+
+        return {
+            "calls": len(samples),
+            "output_ratio": total_out / total_in,
+            "seconds_per_output_token": total_latency / total_out
+        }
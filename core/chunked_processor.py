@@ -1,7 +1,7 @@
 #############################################################
 #### Text chunking for serial processing.
 #############################################################
-from typing import List, Tuple, Callable, Dict, Any
+from typing import List, Tuple, Callable, Dict, Any, Optional, Iterable, Iterator
 
 
 class TextChunker:    
@@ -16,16 +16,21 @@ class TextChunker:
         if len(text) <= TextChunker.CHARS_PER_CHUNK:
             return [text]
         
-        chunks = []
+        chunks = list(TextChunker.iter_chunks(text.split("\n\n")))
+        return chunks if chunks else [text]
+    
+    @staticmethod
+    def iter_chunks(paragraphs: Iterable[str]) -> Iterator[str]:
+        # Lazily pack paragraphs into chunks (same rules as split), so
+        # callers streaming from disk never hold the whole text.
         current = ""
-        paragraphs = text.split("\n\n")
         
         for para in paragraphs:
             if len(current) + len(para) <= TextChunker.CHARS_PER_CHUNK:
                 current += para + "\n\n"
             else:
                 if current:
-                    chunks.append(current.strip())
+                    yield current.strip()
                 
                 if len(para) > TextChunker.CHARS_PER_CHUNK:
                     sentences = para.split(". ")
@@ -36,43 +41,70 @@ class TextChunker:
                             chunk_text += sent
                         else:
                             if chunk_text:
-                                chunks.append(chunk_text.strip())
+                                yield chunk_text.strip()
                             chunk_text = sent
                     if chunk_text:
-                        chunks.append(chunk_text.strip())
+                        yield chunk_text.strip()
                 else:
                     current = para + "\n\n"
         
         if current:
-            chunks.append(current.strip())
-        
-        return chunks if chunks else [text]
+            yield current.strip()
     
     @staticmethod
     def process_serial(
         text: str,
         process_fn: Callable[[str, int], Tuple[str, int]],
-        show_progress: bool = True
+        show_progress: bool = True,
+        combine_fn: Optional[Callable[[List[str]], str]] = None
     ) -> Tuple[str, Dict[str, Any]]:
+        # combine_fn merges the per-chunk results; defaults to plain concatenation.
         
         chunks = TextChunker.split(text)
-        total_tokens = len(text) / TextChunker.CHARS_PER_TOKEN
         results = []
+        stats = TextChunker.process_stream(chunks, process_fn, results.append, show_progress, total=len(chunks))
+        
+        combined = combine_fn(results) if combine_fn else "".join(results)
+        return combined, stats
+    
+    @staticmethod
+    def process_stream(
+        chunks: Iterable[str],
+        process_fn: Callable[[str, int], Tuple[str, int]],
+        sink: Callable[[str], None],
+        show_progress: bool = True,
+        total: Optional[int] = None
+    ) -> Dict[str, Any]:
+        # Process chunks one at a time, handing each result to sink (e.g. a
+        # file write); chunks may be produced lazily so nothing is kept.
+        # Args:
+        #     total: Number of chunks, if known up front (for progress output).
+        # Returns:
+        #     Stats dict with the same keys as process_serial.
+
+        total_tokens = 0
         total_output_tokens = 0
+        total_chunks = 0
         failed = 0
         
         if show_progress:
-            print(f"\n📊 Processing {total_tokens:,} tokens in {len(chunks)} chunk(s)")
+            if total is None:
+                print(f"\n📊 Streaming chunks (low-memory mode)")
+            else:
+                print(f"\n📊 Processing {total} chunk(s)")
+        of_total = f"/{total}" if total is not None else ""
         
         for i, chunk in enumerate(chunks, 1):
             chunk_tokens = len(chunk) / TextChunker.CHARS_PER_TOKEN
+            total_tokens += chunk_tokens
+            total_chunks += 1
             
             try:
                 if show_progress:
-                    print(f"  ⏳ Chunk {i}/{len(chunks)} ({chunk_tokens:,} tokens)...", end=" ")
+                    print(f"  ⏳ Chunk {i}{of_total} ({chunk_tokens:,} tokens)...", end=" ")
                 
                 result, output_tokens = process_fn(chunk, i)
-                results.append(result)
+                sink(result)
                 total_output_tokens += output_tokens
                 
                 if show_progress:
@@ -83,15 +115,13 @@ class TextChunker:
                 if show_progress:
                     print(f"❌ {str(e)[:50]}")
         
-        stats = {
+        if show_progress:
+            print(f"✅ Complete")
+        
+        return {
             "total_input_tokens": total_tokens,
             "total_output_tokens": total_output_tokens,
-            "chunks_processed": len(chunks) - failed,
+            "chunks_processed": total_chunks - failed,
             "chunks_failed": failed,
-            "total_chunks": len(chunks)
+            "total_chunks": total_chunks
         }
-        
-        if show_progress:
-            print(f"✅ Complete")
-        
-        return "".join(results), stats
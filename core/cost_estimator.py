@@ -0,0 +1,144 @@
+#############################################################
+####  Pre-flight call count, token and wall-time estimates.
+#############################################################
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+from core.call_history import CallHistory
+from core.chunked_processor import TextChunker
+from core.groq_client import MAX_TOKENS_PER_MINUTE, SYSTEM_PROMPT
+from prompts.assessment import (
+    get_rephrase_clarify_prompt,
+    get_schema_prompt,
+    get_assessment_prompt
+)
+
+# Characters of source text sent to the schema prompt
+SCHEMA_CHARS = 8000
+MAX_OUTPUT_TOKENS = 4096
+CALL_OVERHEAD_SECONDS = 0.5
+
+# Used until the call history has samples for the model/output type
+DEFAULT_PROFILES = {
+    "notes": {"output_ratio": 0.4, "seconds_per_output_token": 0.005},
+    "schema": {"output_ratio": 0.5, "seconds_per_output_token": 0.005},
+    "assessment": {"output_ratio": 0.1, "seconds_per_output_token": 0.005},
+}
+
+# Template overhead (system prompt + instructions) per output type
+PROMPT_OVERHEAD = {
+    "notes": TextChunker.estimate_tokens(SYSTEM_PROMPT + get_rephrase_clarify_prompt("")),
+    "schema": TextChunker.estimate_tokens(SYSTEM_PROMPT + get_schema_prompt("")),
+    "assessment": TextChunker.estimate_tokens(SYSTEM_PROMPT + get_assessment_prompt("", "Level 1 (Remember)")),
+}
+
+
+def format_duration(seconds: float) -> str:
+    minutes, secs = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m"
+    if minutes:
+        return f"{minutes}m {secs:02d}s"
+    return f"{secs}s"
+
+
+class CostEstimator:
+    # Predicts calls, tokens and wall time for each output type of a document
+    # from the chunking, the rate limit and the recorded call history.
+
+    def __init__(
+        self,
+        model: Optional[str] = None,
+        history: Optional[CallHistory] = None,
+        rate_limit: int = MAX_TOKENS_PER_MINUTE
+    ):
+        # Args:
+        #     model: Model name (defaults to GROQ_MODEL).
+        #     history: Call history to draw statistics from.
+        #     rate_limit: Tokens per minute allowed by the API.
+
+        self.model = model or os.getenv("GROQ_MODEL", "unknown")
+        self.history = history if history is not None else CallHistory()
+        self.rate_limit = rate_limit
+
+    def _profile(self, kind: str) -> Dict[str, Any]:
+        summary = self.history.summary(self.model, kind)
+        if summary:
+            return dict(summary, source=f"history ({summary['calls']} calls)")
+        return dict(DEFAULT_PROFILES[kind], source="defaults")
+
+    def _calls(self, kind: str, input_sizes: List[int]) -> Dict[str, Any]:
+        # Estimate one call per entry in input_sizes (source tokens per call).
+        profile = self._profile(kind)
+        input_tokens = output_tokens = 0
+        latency = 0.0
+
+        for size in input_sizes:
+            call_in = size + PROMPT_OVERHEAD[kind]
+            call_out = min(MAX_OUTPUT_TOKENS, int(call_in * profile["output_ratio"]))
+            input_tokens += call_in
+            output_tokens += call_out
+            latency += CALL_OVERHEAD_SECONDS + call_out * profile["seconds_per_output_token"]
+
+        return {
+            "calls": len(input_sizes),
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "latency_seconds": latency,
+            "sources": [f"{kind}: {profile['source']}"]
+        }
+
+    def _finish(self, *parts: Dict[str, Any]) -> Dict[str, Any]:
+        # Merge call groups and derive the expected wall time: calls are serial,
+        # and anything beyond the first minute's token budget waits on the limiter.
+        total = {
+            "calls": sum(p["calls"] for p in parts),
+            "input_tokens": sum(p["input_tokens"] for p in parts),
+            "output_tokens": sum(p["output_tokens"] for p in parts),
+            "latency_seconds": sum(p["latency_seconds"] for p in parts),
+            "sources": [s for p in parts for s in p["sources"]]
+        }
+        tokens = total["input_tokens"] + total["output_tokens"]
+        throttle = max(0, tokens - self.rate_limit) / self.rate_limit * 60
+        last_call = total["latency_seconds"] / total["calls"] if total["calls"] else 0.0
+        total["wall_seconds"] = max(total["latency_seconds"], throttle + last_call)
+        return total
+
+    def estimate_chunks(self, chunk_tokens: List[int], schema_tokens: int) -> Dict[str, Dict[str, Any]]:
+        # Estimate from pre-computed chunk sizes.
+        # Args:
+        #     chunk_tokens: Source tokens of each chunk, in order.
+        #     schema_tokens: Source tokens sent to the schema prompt.
+        # Returns:
+        #     {output_type: {calls, input_tokens, output_tokens, latency_seconds, wall_seconds, sources}}
+
+        return {
+            "Rephrase & Clarify": self._finish(
+                self._calls("notes", chunk_tokens),
+                self._calls("schema", [schema_tokens])
+            ),
+            "Generate Assessment": self._finish(self._calls("assessment", chunk_tokens)),
+        }
+
+    def estimate(self, text: str) -> Dict[str, Dict[str, Any]]:
+        # Estimate every output type for a document's extracted text.
+        chunk_tokens = [TextChunker.estimate_tokens(c) for c in TextChunker.split(text)]
+        return self.estimate_chunks(chunk_tokens, TextChunker.estimate_tokens(text[:SCHEMA_CHARS]))
+
+    def estimate_stream(self, chunks: Iterable[str], schema_text: str) -> Dict[str, Dict[str, Any]]:
+        # Same as estimate, for lazily produced chunks (low-memory mode).
+        chunk_tokens = [TextChunker.estimate_tokens(c) for c in chunks]
+        return self.estimate_chunks(chunk_tokens, TextChunker.estimate_tokens(schema_text))
+
+    def format(self, estimates: Dict[str, Dict[str, Any]]) -> str:
+        # Human-readable summary for the status box / CLI.
+        lines = [f"⏱️ Estimate ({self.model}, {self.rate_limit:,} tokens/min):"]
+        for name, est in estimates.items():
+            lines.append(
+                f"- {name}: {est['calls']} call(s), ~{est['input_tokens']:,} in / "
+                f"~{est['output_tokens']:,} out tokens, ~{format_duration(est['wall_seconds'])}"
+            )
+        sources = sorted({s for est in estimates.values() for s in est["sources"]})
+        lines.append(f"  Based on: {', '.join(sources)}")
+        return "\n".join(lines)
@@ -8,7 +8,11 @@ from groq import Groq
 from typing import Tuple
 from dotenv import load_dotenv
 
+from core.call_history import CallHistory
+from core.chunked_processor import TextChunker
+
 MAX_TOKENS_PER_MINUTE = 5500
+SYSTEM_PROMPT = "You are an expert educator creating structured Markdown content for Obsidian. Output only Markdown—no explanations or meta-text."
 
 
 class GroqClient:
@@ -30,6 +34,9 @@ class GroqClient:
         # Rate limiter state
         self.tokens_used = 0
         self.window_start = time.time()
+        
+        # Per-call latency / output-size samples for estimates
+        self.history = CallHistory()
     
     def _check_rate_limit(self, tokens: int) -> bool:
         # Check if tokens can be processed without exceeding limit.
@@ -43,21 +50,24 @@ class GroqClient:
         self,
         prompt: str,
         temperature: float = 0.7,
-        max_tokens: int = 4096
+        max_tokens: int = 4096,
+        kind: str = "general"
     ) -> Tuple[str, int]:
         # Generate text using Groq API.
         # Args:
         #     prompt: Input prompt
         #     temperature: Sampling temperature (0.0-1.0)
         #     max_tokens: Max tokens in response
+        #     kind: Output type recorded in the call history
         # Returns:
         #     (response_text, output_tokens_count)
 
+        started = time.time()
         message = self.client.chat.completions.create(
             messages=[
                 {
                     "role": "system",
-                    "content": "You are an expert educator creating structured Markdown content for Obsidian. Output only Markdown—no explanations or meta-text."
+                    "content": SYSTEM_PROMPT
                 },
                 {"role": "user", "content": prompt}
             ],
@@ -71,5 +81,11 @@ class GroqClient:
         
         self.tokens_used += output_tokens
         
+        input_tokens = (
+            message.usage.prompt_tokens if hasattr(message, 'usage')
+            else TextChunker.estimate_tokens(SYSTEM_PROMPT + prompt)
+        )
+        self.history.record(self.model, kind, input_tokens, output_tokens, time.time() - started)
+        
         return response_text, output_tokens
 
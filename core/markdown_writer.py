@@ -2,6 +2,8 @@
 ####       Markdown file generation and management module.
 #############################################################
 import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 
 
@@ -14,8 +16,18 @@ class MarkdownWriter:
         #     output_dir: Directory to save generated files.
 
         self.output_dir = output_dir
+        self.streaming = set()  # paths currently being written by open_stream
+        self._streaming_lock = threading.Lock()
         os.makedirs(output_dir, exist_ok=True)
     
+    def _filepath(self, filename: str) -> str:
+        # Sanitize filename and resolve it inside the output directory.
+        filename = filename.replace(" ", "_")
+        if not filename.endswith(".md"):
+            filename += ".md"
+        
+        return os.path.join(self.output_dir, filename)
+    
     def save_file(self, filename: str, content: str) -> str:
         # Save Markdown content to file.
         # Args:
@@ -24,18 +36,39 @@ class MarkdownWriter:
         # Returns:
         #     Full path to saved file.
         
-        # Sanitize filename
-        filename = filename.replace(" ", "_")
-        if not filename.endswith(".md"):
-            filename += ".md"
-        
-        filepath = os.path.join(self.output_dir, filename)
+        filepath = self._filepath(filename)
         
         with open(filepath, "w", encoding="utf-8") as f:
             f.write(content)
         
         return filepath
     
+    @contextmanager
+    def open_stream(self, filename: str):
+        # Open an output file for incremental writes (low-memory mode).
+        # If another stream is already writing that name, a numbered
+        # name ("notes_2.md") is used instead, so concurrent runs never
+        # truncate each other's file.
+        # Args:
+        #     filename: Name for the output file.
+        # Yields:
+        #     (full_path, writable text file)
+        
+        base = self._filepath(filename)[:-len(".md")]
+        
+        with self._streaming_lock:
+            filepath, n = base + ".md", 1
+            while filepath in self.streaming:
+                n += 1
+                filepath = f"{base}_{n}.md"
+            self.streaming.add(filepath)
+        try:
+            with open(filepath, "w", encoding="utf-8") as f:
+                yield filepath, f
+        finally:
+            with self._streaming_lock:
+                self.streaming.discard(filepath)
+    
     def get_file_list(self) -> list:
         # Get list of generated files.
         # Returns:
@@ -51,8 +84,14 @@ class MarkdownWriter:
         ]
     
     def clear_outputs(self) -> None:
-        # Clear all output files from the output directory.
+        # Clear all output files from the output directory,
+        # except files a running job is still streaming into.
+        with self._streaming_lock:
+            streaming = set(self.streaming)
+        
         for filepath in self.get_file_list():
+            if filepath in streaming:
+                continue
             try:
                 os.remove(filepath)
             except Exception as e:
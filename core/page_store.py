@@ -0,0 +1,69 @@
+#############################################################
+####    Disk-backed page text store for low-memory processing.
+#############################################################
+import os
+import weakref
+import tempfile
+from typing import Iterator
+
+from core.chunked_processor import TextChunker
+
+
+class PageStore:
+    # Spills extracted page text to a temp file so only one page (or one
+    # read block) is resident at a time. Each reader opens its own handle,
+    # so several jobs can stream the same document concurrently.
+
+    READ_BLOCK = 64 * 1024
+
+    def __init__(self):
+        fd, self.path = tempfile.mkstemp(prefix="pdf_pages_", suffix=".txt")
+        self._file = os.fdopen(fd, "w", encoding="utf-8", newline="")
+        self._finalizer = weakref.finalize(self, PageStore._remove, self._file, self.path)
+        self.pages = 0
+        self.chars = 0
+
+    @staticmethod
+    def _remove(handle, path: str) -> None:
+        handle.close()
+        if os.path.exists(path):
+            os.remove(path)
+
+    def append_page(self, text: str) -> None:
+        # Same layout as extract_text_from_pdf: each page followed by a newline.
+        self._file.write(text + "\n")
+        self.pages += 1
+        self.chars += len(text) + 1
+
+    def finish(self) -> None:
+        # Flush pending writes; call once extraction is done.
+        self._file.flush()
+
+    def estimate_tokens(self) -> int:
+        return self.chars // TextChunker.CHARS_PER_TOKEN
+
+    def head(self, n: int) -> str:
+        # First n characters of the stored text.
+        with open(self.path, "r", encoding="utf-8", newline="") as f:
+            return f.read(n)
+
+    def iter_paragraphs(self) -> Iterator[str]:
+        # Yield the same pieces as text.split("\n\n") without loading the text.
+        with open(self.path, "r", encoding="utf-8", newline="") as f:
+            buffer = ""
+            while True:
+                block = f.read(self.READ_BLOCK)
+                if not block:
+                    break
+                buffer += block
+                parts = buffer.split("\n\n")
+                buffer = parts.pop()
+                yield from parts
+            yield buffer
+
+    def iter_chunks(self) -> Iterator[str]:
+        return TextChunker.iter_chunks(self.iter_paragraphs())
+
+    def close(self) -> None:
+        # Delete the temp file (also happens when the store is garbage collected).
+        self._finalizer()
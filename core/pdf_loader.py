@@ -1,8 +1,13 @@
 #############################################################
 ####                    PDF text extraction module.
 #############################################################
+import gc
 import io
-from pypdf import PdfReader
+import mmap
+from pypdf import PdfReader, PageObject
+from pypdf.generic import IndirectObject, NameObject
+
+from core.page_store import PageStore
 
 
 def extract_text_from_pdf(pdf_file) -> str:
@@ -35,3 +40,103 @@ def extract_text_from_pdf(pdf_file) -> str:
         raise ValueError("No readable text found in PDF")
     
     return text.strip()
+
+
+PAGE_WINDOW = 100
+INHERITABLE_PAGE_ATTRIBUTES = ("/Resources", "/MediaBox", "/CropBox", "/Rotate")
+
+
+def _is_page_tree(node) -> bool:
+    # A /Pages node; untyped nodes count as a tree if they have /Kids.
+    if "/Type" in node:
+        return node["/Type"] == "/Pages"
+    return "/Kids" in node
+
+
+def _iter_pages(reader: PdfReader, node, inherited: dict, path: tuple, resume: tuple):
+    # Walk the page tree lazily, yielding (path, PageObject) one page at a time.
+    # Unlike reader.pages, nothing is kept once the caller moves on.
+    # resume is the path of the last page already processed (skipped here).
+
+    inherited = dict(inherited)
+    for attr in INHERITABLE_PAGE_ATTRIBUTES:
+        if attr in node:
+            inherited[attr] = node[attr]
+
+    kids = node.get("/Kids", [])
+    first = resume[0] if resume else 0
+
+    for i in range(first, len(kids)):
+        ref = kids[i]
+        kid = ref.get_object()
+        if not kid:
+            # Damaged file may have invalid child in /Pages
+            continue
+
+        resuming = bool(resume) and i == first
+        if _is_page_tree(kid):
+            yield from _iter_pages(reader, kid, inherited, path + (i,), resume[1:] if resuming else ())
+        elif not resuming:
+            page = PageObject(reader, ref if isinstance(ref, IndirectObject) else None)
+            page.update(kid)
+            for attr, value in inherited.items():
+                if attr not in page:
+                    page[NameObject(attr)] = value
+            yield path + (i,), page
+
+
+def extract_pages_to_store(pdf_path: str) -> PageStore:
+    # Low-memory extraction: the PDF is memory-mapped instead of read into
+    # memory, and each page's text is spilled to a PageStore as it is extracted.
+    # Pages are read in windows of PAGE_WINDOW with a fresh reader per window,
+    # so parsed objects never accumulate beyond one window.
+    # Args:
+    #     pdf_path: Path to PDF.
+    # Returns:
+    #     PageStore holding the extracted text.
+    # Raises:
+    #     ValueError: If PDF is empty or unreadable.
+
+    store = PageStore()
+    pages = 0
+    has_text = False
+
+    try:
+        with open(pdf_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            resume = ()
+            while True:
+                reader = PdfReader(mapped)
+                root = reader.trailer["/Root"]["/Pages"].get_object()
+                window = 0
+
+                for path, page in _iter_pages(reader, root, {}, (), resume):
+                    extracted = page.extract_text()
+                    if extracted:
+                        store.append_page(extracted)
+                        has_text = has_text or bool(extracted.strip())
+                    resume = path
+                    pages += 1
+                    window += 1
+                    if window == PAGE_WINDOW:
+                        break
+                else:
+                    break
+
+                # Release this window's reader (its objects reference it cyclically)
+                # and the mapped file pages; they are re-read from the OS cache if needed
+                del reader, root, page
+                gc.collect()
+                if hasattr(mapped, 'madvise'):
+                    mapped.madvise(mmap.MADV_DONTNEED)
+
+        if not pages:
+            raise ValueError("PDF contains no pages")
+
+        if not has_text:
+            raise ValueError("No readable text found in PDF")
+    except Exception:
+        store.close()
+        raise
+
+    store.finish()
+    return store
@@ -0,0 +1,246 @@
+#############################################################
+####   Local deduplication of per-chunk question sets.
+#############################################################
+import re
+import random
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+# "Q1. ...", "**Q2:** ...", "- Q3) ...", "### Q4 - ...", "**Q5** ...", "1. Q6. ..."; a separator
+# is required so body text such as "Q4 earnings fell" or "Q3.5%" is left alone
+QUESTION_LINE = re.compile(
+    r"^\s*(?:#{1,6}\s+)?(?:[-*+]\s+)?(?:\d+[.)]\s+)?(?:\*\*|__)?Q\d+"
+    r"(?:\s*[:.)\-](?=\s|\*\*|__|$)\s*(?:\*\*|__)?|(?:\*\*|__)\s*[:.)\-]?)"
+    r"\s*(?P<text>.*)$"
+)
+HEADING_LINE = re.compile(r"^\s*(#{1,6})\s+(.+?)\s*#*\s*$")
+RULE_LINE = re.compile(r"^\s*(?:-{3,}|\*{3,}|_{3,})\s*$")
+BOLD_LABEL = re.compile(r"^\s*(?:\*\*|__)[^*_].*(?:\*\*|__)\s*:?\s*$")
+
+_PRIME = (1 << 61) - 1
+
+
+def _is_label(line: str) -> bool:
+    # A heading or whole-line bold label ("## Review Questions", "**Level 1 (Remember)**").
+    if QUESTION_LINE.match(line):
+        return False
+    return bool(HEADING_LINE.match(line) or BOLD_LABEL.match(line))
+
+
+def _is_filler(line: str) -> bool:
+    return not line.strip() or bool(RULE_LINE.match(line))
+
+
+def _clean_question(text: str) -> str:
+    # Strip leftover emphasis markers and collapse whitespace.
+    text = re.sub(r"\s+", " ", text).strip()
+    return text.strip("*_ ").strip()
+
+
+def split_questions(text: str) -> Tuple[str, List[str]]:
+    # Separate a chunk output into its content body and its Qn questions.
+    # Labels inside the question block (e.g. "### Level 1 (Remember)") are
+    # dropped with it; a heading followed by regular content, or text after a
+    # blank line, ends the block. Only directly following lines continue a question.
+    # Args:
+    #     text: Markdown produced for a single chunk.
+    # Returns:
+    #     (body_without_questions, list_of_question_texts)
+
+    lines = text.splitlines()
+    first = next((i for i, line in enumerate(lines) if QUESTION_LINE.match(line)), None)
+    if first is None:
+        return text.strip(), []
+
+    # Drop the rules / labels / blank lines leading into the block
+    start = first
+    while start > 0 and (_is_filler(lines[start - 1]) or _is_label(lines[start - 1])):
+        start -= 1
+
+    questions = []
+    tail = []
+    current = None
+    after_gap = False
+    for i in range(first, len(lines)):
+        line = lines[i]
+        match = QUESTION_LINE.match(line)
+        if match:
+            if current is not None:
+                questions.append(current)
+            current = match.group("text")
+            after_gap = False
+        elif _is_filler(line):
+            after_gap = True
+            continue
+        elif _is_label(line):
+            following = next((l for l in lines[i + 1:] if not _is_filler(l) and not _is_label(l)), None)
+            if following is None or not QUESTION_LINE.match(following):
+                # Regular content resumed after the questions
+                tail = lines[i:]
+                break
+        elif after_gap:
+            # Text after a blank line is not part of the question
+            tail = lines[i:]
+            break
+        elif current is not None:
+            current += " " + line.strip()
+
+    if current is not None:
+        questions.append(current)
+
+    body = "\n".join(lines[:start] + ([""] if tail else []) + tail).strip()
+    questions = [q for q in (_clean_question(q) for q in questions) if q]
+    return body, questions
+
+
+class MinHashIndex:
+    # Near-duplicate lookup over short texts using MinHash signatures
+    # and LSH banding, so each query only compares against a few candidates.
+
+    def __init__(
+        self,
+        threshold: float = 0.85,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle_size: int = 2,
+        seed: int = 1
+    ):
+        # Args:
+        #     threshold: Minimum estimated Jaccard similarity to count as duplicate.
+        #     num_perm: Number of hash permutations per signature.
+        #     bands: LSH bands (num_perm must be divisible by bands).
+        #     shingle_size: Word n-gram size. Word shingles keep questions that
+        #         differ only in a key term ("Type I" / "Type II") apart.
+        #     seed: Seed for the permutation parameters.
+
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = random.Random(seed)
+        self._perms = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)]
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(bands)]
+        self._signatures: List[List[int]] = []
+
+    def _shingles(self, text: str) -> set:
+        words = re.sub(r"[^a-z0-9]+", " ", text.lower()).split()
+        k = self.shingle_size
+        if len(words) <= k:
+            return {" ".join(words)}
+        return {" ".join(words[i:i + k]) for i in range(len(words) - k + 1)}
+
+    def signature(self, text: str) -> List[int]:
+        hashes = [zlib.crc32(s.encode("utf-8")) for s in self._shingles(text)]
+        return [min((a * h + b) % _PRIME for h in hashes) for a, b in self._perms]
+
+    def _bands(self, sig: List[int]):
+        for band in range(self.bands):
+            yield band, tuple(sig[band * self.rows:(band + 1) * self.rows])
+
+    def query(self, sig: List[int]) -> Optional[int]:
+        # Return the index of the most similar stored entry above threshold, if any.
+        candidates = set()
+        for band, key in self._bands(sig):
+            candidates.update(self._buckets[band].get(key, ()))
+
+        best, best_score = None, self.threshold
+        for idx in candidates:
+            stored = self._signatures[idx]
+            score = sum(1 for x, y in zip(sig, stored) if x == y) / self.num_perm
+            if score >= best_score:
+                best, best_score = idx, score
+        return best
+
+    def add(self, sig: List[int]) -> int:
+        idx = len(self._signatures)
+        self._signatures.append(sig)
+        for band, key in self._bands(sig):
+            self._buckets[band].setdefault(key, []).append(idx)
+        return idx
+
+
+class QuestionConsolidator:
+    # Merges chunk outputs into one document with a single,
+    # deduplicated and renumbered question section.
+
+    SECTION_TITLE = "Review Questions"
+
+    def __init__(self, threshold: float = 0.85):
+        # Args:
+        #     threshold: Similarity above which two questions are considered the same.
+
+        self.index = MinHashIndex(threshold=threshold)
+        self.questions: List[str] = []
+        self.duplicates = 0
+        self._open_headings: Dict[int, str] = {}  # level -> title of the current section path
+        self._seen_titles = set()
+
+    def _merge_headings(self, body: str) -> str:
+        # Drop leading headings that repeat the section path the previous chunk
+        # ended in (or an already-seen H1 title), so the sections join up.
+        lines = body.splitlines()
+        boundary = 0
+
+        for i, line in enumerate(lines):
+            if not line.strip() or RULE_LINE.match(line):
+                continue
+            match = HEADING_LINE.match(line)
+            if not match:
+                break
+            level, title = len(match.group(1)), match.group(2).strip().lower()
+            if self._open_headings.get(level) != title and not (level == 1 and title in self._seen_titles):
+                break
+            boundary = i + 1
+
+        lines = lines[boundary:]
+
+        for line in lines:
+            match = HEADING_LINE.match(line)
+            if match:
+                level, title = len(match.group(1)), match.group(2).strip().lower()
+                self._open_headings = {l: t for l, t in self._open_headings.items() if l < level}
+                self._open_headings[level] = title
+                if level == 1:
+                    self._seen_titles.add(title)
+
+        return "\n".join(lines).strip()
+
+    def add(self, chunk_output: str) -> str:
+        # Register one chunk output.
+        # Args:
+        #     chunk_output: Markdown produced for a single chunk.
+        # Returns:
+        #     The chunk body with its questions removed and headings merged.
+
+        body, questions = split_questions(chunk_output)
+        for question in questions:
+            sig = self.index.signature(question)
+            if self.index.query(sig) is not None:
+                self.duplicates += 1
+                continue
+            self.index.add(sig)
+            self.questions.append(question)
+        return self._merge_headings(body)
+
+    def render_questions(self) -> str:
+        # Render the consolidated question section (empty if no questions).
+        if not self.questions:
+            return ""
+        numbered = "\n".join(f"Q{i}. {q}" for i, q in enumerate(self.questions, 1))
+        return f"---\n## {self.SECTION_TITLE}\n\n{numbered}\n"
+
+    def consolidate(self, outputs: List[str]) -> str:
+        # Combine chunk outputs into a single Markdown document.
+        # Args:
+        #     outputs: Per-chunk Markdown results, in order.
+        # Returns:
+        #     Merged content followed by one consolidated question section.
+
+        bodies = [body for body in (self.add(output) for output in outputs) if body]
+        parts = bodies + [self.render_questions().strip()]
+        return "\n\n".join(p for p in parts if p) + "\n"
@@ -0,0 +1,204 @@
+#############################################################
+####   Chunk-level priority scheduler in front of GroqClient.
+#############################################################
+import time
+import itertools
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.chunked_processor import TextChunker
+
+PRIORITY_LEVELS = {"High": 0, "Normal": 1, "Low": 2}
+
+
+class _Task:
+    # One pending LLM call (a chunk, or a schema prompt) belonging to a job.
+
+    def __init__(self, job: "ScheduledJob", prompt: str, kwargs: Dict[str, Any], seq: int):
+        self.job = job
+        self.prompt = prompt
+        self.kwargs = kwargs
+        self.seq = seq
+        self.tokens = TextChunker.estimate_tokens(prompt)
+        self.enqueued_at = time.time()
+        self.done = threading.Event()
+        self.result: Optional[Tuple[str, int]] = None
+        self.error: Optional[Exception] = None
+
+
+class ScheduledJob:
+    # Handle for one document/output-type run. Its generate_text has the
+    # same signature as GroqClient's, so it can be used as a drop-in client.
+
+    def __init__(self, scheduler: "ChunkScheduler", job_id: int, user: str, label: str, priority: int, total_tokens: int):
+        self.scheduler = scheduler
+        self.job_id = job_id
+        self.user = user
+        self.label = label
+        self.priority = priority
+        self.remaining_tokens = total_tokens
+        self.calls_done = 0
+        self.created_at = time.time()
+
+    def generate_text(self, prompt: str, **kwargs) -> Tuple[str, int]:
+        # Queue one call and block until the scheduler has run it.
+        return self.scheduler._submit(self, prompt, kwargs)
+
+    def close(self) -> None:
+        self.scheduler._close(self)
+
+    def __enter__(self) -> "ScheduledJob":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ChunkScheduler:
+    # Dispatches queued calls one at a time. Among pending calls it picks by
+    # (priority, user's recent token usage, job's remaining tokens), i.e.
+    # strict priority, then per-user fair share, then shortest job first,
+    # so small interactive jobs interleave with large batch jobs.
+
+    USAGE_HALF_LIFE = 300  # seconds for a user's recorded token usage to halve
+    WAIT_SAMPLES = 100
+
+    def __init__(self, client):
+        # Args:
+        #     client: GroqClient (or anything with generate_text).
+
+        self.client = client
+        self._cond = threading.Condition()
+        self._pending: List[_Task] = []
+        self._jobs: Dict[int, ScheduledJob] = {}
+        self._usage: Dict[str, Tuple[float, float]] = {}  # user -> (tokens, updated_at)
+        self._waits = deque(maxlen=self.WAIT_SAMPLES)
+        self._running: Optional[_Task] = None
+        self._ids = itertools.count(1)
+        self._seq = itertools.count()
+        self._worker = None
+
+    def open_job(self, user: str, label: str, total_tokens: int, priority: str = "Normal") -> ScheduledJob:
+        # Register a job before submitting its chunks.
+        # Args:
+        #     user: Identifier used for fair share (e.g. Gradio session).
+        #     label: Shown in the queue status.
+        #     total_tokens: Estimated input tokens of the whole job (for shortest-job-first).
+        #     priority: One of PRIORITY_LEVELS.
+        # Returns:
+        #     ScheduledJob handle; close it (or use it as a context manager) when done.
+
+        if priority not in PRIORITY_LEVELS:
+            raise ValueError(f"Unknown priority: {priority}")
+
+        with self._cond:
+            job = ScheduledJob(self, next(self._ids), user, label, PRIORITY_LEVELS[priority], total_tokens)
+            self._jobs[job.job_id] = job
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="chunk-scheduler", daemon=True)
+                self._worker.start()
+        return job
+
+    def _close(self, job: ScheduledJob) -> None:
+        with self._cond:
+            self._jobs.pop(job.job_id, None)
+
+    def _submit(self, job: ScheduledJob, prompt: str, kwargs: Dict[str, Any]) -> Tuple[str, int]:
+        task = _Task(job, prompt, kwargs, next(self._seq))
+        with self._cond:
+            self._pending.append(task)
+            self._cond.notify()
+
+        task.done.wait()
+        if task.error is not None:
+            raise task.error
+        return task.result
+
+    def _user_usage(self, user: str, now: float) -> float:
+        tokens, updated_at = self._usage.get(user, (0.0, now))
+        return tokens * 0.5 ** ((now - updated_at) / self.USAGE_HALF_LIFE)
+
+    def _select(self) -> _Task:
+        now = time.time()
+        return min(
+            self._pending,
+            key=lambda t: (t.job.priority, self._user_usage(t.job.user, now), t.job.remaining_tokens, t.seq)
+        )
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                task = self._select()
+                self._pending.remove(task)
+                self._running = task
+                self._waits.append(time.time() - task.enqueued_at)
+
+            try:
+                task.result = self.client.generate_text(task.prompt, **task.kwargs)
+                used = task.tokens + task.result[1]
+            except Exception as e:
+                task.error = e
+                used = task.tokens
+
+            with self._cond:
+                now = time.time()
+                self._usage[task.job.user] = (self._user_usage(task.job.user, now) + used, now)
+                task.job.remaining_tokens = max(0, task.job.remaining_tokens - task.tokens)
+                task.job.calls_done += 1
+                self._running = None
+            task.done.set()
+
+    def status(self) -> Dict[str, Any]:
+        # Snapshot of queue depth, wait times and open jobs.
+        with self._cond:
+            now = time.time()
+            waits = list(self._waits)
+            pending_by_job = {}
+            for task in self._pending:
+                pending_by_job.setdefault(task.job.job_id, []).append(now - task.enqueued_at)
+
+            jobs = [
+                {
+                    "job_id": job.job_id,
+                    "user": job.user,
+                    "label": job.label,
+                    "priority": next(k for k, v in PRIORITY_LEVELS.items() if v == job.priority),
+                    "calls_done": job.calls_done,
+                    "remaining_tokens": job.remaining_tokens,
+                    "waiting_seconds": max(pending_by_job[job.job_id]) if job.job_id in pending_by_job else None,
+                    "running": self._running is not None and self._running.job is job
+                }
+                for job in self._jobs.values()
+            ]
+
+            return {
+                "queue_depth": len(self._pending),
+                "running": self._running.job.label if self._running else None,
+                "avg_wait_seconds": sum(waits) / len(waits) if waits else 0.0,
+                "max_wait_seconds": max(waits) if waits else 0.0,
+                "wait_samples": len(waits),
+                "jobs": jobs
+            }
+
+    def format_status(self) -> str:
+        # Human-readable queue summary for the UI.
+        status = self.status()
+        lines = [
+            f"Queue depth: {status['queue_depth']} | Running: {status['running'] or '-'}",
+            f"Wait (last {status['wait_samples']} calls): avg {status['avg_wait_seconds']:.1f}s, max {status['max_wait_seconds']:.1f}s"
+        ]
+        for job in status["jobs"]:
+            if job["running"]:
+                state = "running"
+            elif job["waiting_seconds"] is not None:
+                state = f"waiting {job['waiting_seconds']:.0f}s"
+            else:
+                state = "between calls"
+            lines.append(
+                f"- #{job['job_id']} {job['label']} [{job['priority']}] user {job['user'][:8]}: "
+                f"{job['calls_done']} call(s) done, ~{job['remaining_tokens']:,} tokens left, {state}"
+            )
+        return "\n".join(lines)
@@ -4,6 +4,7 @@
 #!/usr/bin/env python3
 import os
 import sys
+import argparse
 from pathlib import Path
 
 # Add app directory to path
@@ -13,12 +14,30 @@ from dotenv import load_dotenv
 from ui.gradio_ui import create_ui
 
 
+def print_estimate(pdf_path: str):
+    # Print call count, token and wall-time estimates for a PDF.
+    from core.pdf_loader import extract_text_from_pdf
+    from core.cost_estimator import CostEstimator
+
+    text = extract_text_from_pdf(pdf_path)
+    estimator = CostEstimator()
+    print(f"📄 {Path(pdf_path).name}")
+    print(estimator.format(estimator.estimate(text)))
+
+
 def main():
     # Launch the Gradio application.
+    parser = argparse.ArgumentParser(description="PDF → Obsidian Notes Generator")
+    parser.add_argument("--estimate", metavar="PDF", help="print cost and wall-time estimates for a PDF and exit")
+    args = parser.parse_args()
     
     # Load environment variables from .env file
     load_dotenv()
     
+    if args.estimate:
+        print_estimate(args.estimate)
+        return
+    
     api_key = os.getenv("GROQ_API_KEY")
     if not api_key:
         raise ValueError("GROQ_API_KEY not in .env")
@@ -0,0 +1,92 @@
+import os
+
+import pytest
+
+# core.cost_estimator pulls the rate limit and system prompt from the Groq client
+pytest.importorskip("groq")
+pytest.importorskip("dotenv")
+
+from core.call_history import CallHistory
+from core.cost_estimator import (
+    CostEstimator,
+    DEFAULT_PROFILES,
+    MAX_OUTPUT_TOKENS,
+    PROMPT_OVERHEAD,
+    format_duration
+)
+
+MODEL = "test-model"
+
+
+@pytest.fixture
+def history(tmp_path):
+    return CallHistory(str(tmp_path / "history.json"))
+
+
+def test_single_chunk_is_not_throttled(history):
+    estimator = CostEstimator(MODEL, history, rate_limit=5500)
+    est = estimator.estimate_chunks([1000], 500)["Generate Assessment"]
+
+    call_in = 1000 + PROMPT_OVERHEAD["assessment"]
+    assert est["calls"] == 1
+    assert est["input_tokens"] == call_in
+    assert est["output_tokens"] == int(call_in * DEFAULT_PROFILES["assessment"]["output_ratio"])
+    assert est["wall_seconds"] == est["latency_seconds"]
+
+
+def test_rate_limit_dominates_large_documents(history):
+    estimator = CostEstimator(MODEL, history, rate_limit=5500)
+    est = estimator.estimate_chunks([5000] * 20, 2000)["Rephrase & Clarify"]
+
+    tokens = est["input_tokens"] + est["output_tokens"]
+    throttle = (tokens - 5500) / 5500 * 60
+    assert est["calls"] == 21
+    assert throttle > est["latency_seconds"]
+    assert est["wall_seconds"] == pytest.approx(throttle + est["latency_seconds"] / est["calls"])
+
+
+def test_history_overrides_default_profile(history):
+    for _ in range(3):
+        history.record(MODEL, "assessment", 1000, 200, 2.0)
+    estimator = CostEstimator(MODEL, history)
+    est = estimator.estimate_chunks([1000], 500)["Generate Assessment"]
+
+    call_in = 1000 + PROMPT_OVERHEAD["assessment"]
+    call_out = int(call_in * 0.2)
+    assert est["output_tokens"] == call_out
+    assert est["latency_seconds"] == pytest.approx(0.5 + call_out * 0.01)
+    assert est["sources"] == ["assessment: history (3 calls)"]
+
+    # Other models still fall back to the defaults
+    other = CostEstimator("other-model", history).estimate_chunks([1000], 500)
+    assert other["Generate Assessment"]["sources"] == ["assessment: defaults"]
+
+
+def test_output_is_capped_per_call(history):
+    est = CostEstimator(MODEL, history).estimate_chunks([20000, 20000], 500)["Rephrase & Clarify"]
+    notes_out = est["output_tokens"] - int((500 + PROMPT_OVERHEAD["schema"]) * DEFAULT_PROFILES["schema"]["output_ratio"])
+    assert notes_out == 2 * MAX_OUTPUT_TOKENS
+
+
+def test_format_duration():
+    assert format_duration(0) == "0s"
+    assert format_duration(42.4) == "42s"
+    assert format_duration(65) == "1m 05s"
+    assert format_duration(3725) == "1h 02m"
+
+
+def test_history_trims_and_persists(tmp_path):
+    path = tmp_path / "app" / "history.json"
+    history = CallHistory(str(path))
+    for i in range(CallHistory.MAX_SAMPLES + 5):
+        history.record(MODEL, "notes", 100 + i, 50, 1.0)
+
+    samples = history.samples[f"{MODEL}:notes"]
+    assert len(samples) == CallHistory.MAX_SAMPLES
+    assert samples[0]["input_tokens"] == 105
+
+    reloaded = CallHistory(str(path))
+    assert reloaded.samples == history.samples
+    assert reloaded.summary(MODEL, "notes")["calls"] == CallHistory.MAX_SAMPLES
+    # The atomic save leaves no temp files behind
+    assert os.listdir(path.parent) == ["history.json"]
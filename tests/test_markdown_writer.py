@@ -0,0 +1,23 @@
+import os
+
+from core.markdown_writer import MarkdownWriter
+
+
+def test_concurrent_streams_get_distinct_files(tmp_path):
+    writer = MarkdownWriter(str(tmp_path))
+    with writer.open_stream("doc_notes") as (first_path, first):
+        first.write("first")
+        with writer.open_stream("doc_notes") as (second_path, second):
+            second.write("second")
+            assert second_path != first_path
+            assert os.path.basename(second_path) == "doc_notes_2.md"
+
+            writer.clear_outputs()
+            assert os.path.exists(first_path) and os.path.exists(second_path)
+
+    with open(first_path, encoding="utf-8") as f:
+        assert f.read() == "first"
+    assert writer.streaming == set()
+
+    writer.clear_outputs()
+    assert writer.get_file_list() == []
@@ -0,0 +1,51 @@
+import os
+
+from core.chunked_processor import TextChunker
+from core.page_store import PageStore
+
+
+def _store(pages):
+    store = PageStore()
+    for page in pages:
+        store.append_page(page)
+    store.finish()
+    return store
+
+
+def test_iter_paragraphs_matches_split_across_block_boundaries():
+    text_pages = ["alpha\n\nbeta", "\ngamma\n\n\ndelta", "", "epsilon\n"]
+    expected = "".join(p + "\n" for p in text_pages).split("\n\n")
+
+    for block in (1, 2, 3, 7, 64 * 1024):
+        store = _store(text_pages)
+        store.READ_BLOCK = block
+        assert list(store.iter_paragraphs()) == expected
+        store.close()
+
+
+def test_iter_chunks_matches_split():
+    paragraph = "Sentence number one. " * 40
+    text_pages = ["\n\n".join(paragraph for _ in range(10)) for _ in range(30)]
+    store = _store(text_pages)
+    text = "".join(p + "\n" for p in text_pages)
+
+    assert list(store.iter_chunks()) == TextChunker.split(text)
+    assert store.chars == len(text)
+    assert store.head(50) == text[:50]
+    store.close()
+
+
+def test_close_removes_temp_file():
+    store = _store(["page"])
+    path = store.path
+    assert os.path.exists(path)
+    store.close()
+    assert not os.path.exists(path)
+    store.close()  # idempotent
+
+
+def test_garbage_collection_removes_temp_file():
+    store = _store(["page"])
+    path = store.path
+    del store
+    assert not os.path.exists(path)
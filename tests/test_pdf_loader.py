@@ -0,0 +1,90 @@
+import glob
+import os
+import tempfile
+
+import pytest
+
+pytest.importorskip("pypdf")
+
+from core import pdf_loader  # noqa: E402
+from core.pdf_loader import extract_pages_to_store, extract_text_from_pdf  # noqa: E402
+
+
+def _write_pdf(path, tree):
+    # tree: nested lists of page strings; each list becomes a /Pages node.
+    # MediaBox and the font live on the root node and are inherited.
+    objects = {}
+    ids = iter(range(3, 10000))
+
+    def build(node, parent):
+        node_id = next(ids)
+        kids = []
+        for kid in node:
+            if isinstance(kid, list):
+                kids.append(build(kid, node_id))
+            else:
+                stream = f"BT /F1 12 Tf 72 720 Td ({kid}) Tj ET".encode("latin-1")
+                content_id, page_id = next(ids), next(ids)
+                objects[content_id] = b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream"
+                objects[page_id] = b"<< /Type /Page /Parent %d 0 R /Contents %d 0 R >>" % (node_id, content_id)
+                kids.append(page_id)
+        count = sum(1 for _ in _leaves(node))
+        parent_ref = b"/Parent %d 0 R " % parent if parent else b""
+        inherited = b"" if parent else b"/MediaBox [0 0 612 792] /Resources << /Font << /F1 2 0 R >> >> "
+        objects[node_id] = b"<< /Type /Pages %s%s/Kids [%s] /Count %d >>" % (
+            parent_ref, inherited, b" ".join(b"%d 0 R" % k for k in kids), count
+        )
+        return node_id
+
+    root = build(tree, None)
+    objects[1] = b"<< /Type /Catalog /Pages %d 0 R >>" % root
+    objects[2] = b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+
+    with open(path, "wb") as f:
+        f.write(b"%PDF-1.4\n")
+        offsets = {}
+        for obj_id in sorted(objects):
+            offsets[obj_id] = f.tell()
+            f.write(b"%d 0 obj\n" % obj_id + objects[obj_id] + b"\nendobj\n")
+        xref = f.tell()
+        size = max(objects) + 1
+        f.write(b"xref\n0 %d\n0000000000 65535 f \n" % size)
+        for obj_id in range(1, size):
+            f.write(b"%010d 00000 n \n" % offsets.get(obj_id, 0))
+        f.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref))
+
+
+def _leaves(node):
+    for kid in node:
+        if isinstance(kid, list):
+            yield from _leaves(kid)
+        else:
+            yield kid
+
+
+@pytest.mark.parametrize("window", [1, 2, 3, 100])
+def test_windows_resume_across_nested_page_tree(tmp_path, monkeypatch, window):
+    tree = [["p1", ["p2", "p3"], "p4"], "p5", [[["p6"]], "p7"]]
+    path = str(tmp_path / "nested.pdf")
+    _write_pdf(path, tree)
+    monkeypatch.setattr(pdf_loader, "PAGE_WINDOW", window)
+
+    store = extract_pages_to_store(path)
+    with open(store.path, encoding="utf-8") as f:
+        text = f.read()
+
+    assert store.pages == 7
+    assert text.split() == ["p1", "p2", "p3", "p4", "p5", "p6", "p7"]
+    assert text.strip() == extract_text_from_pdf(path)
+    store.close()
+
+
+def test_corrupt_pdf_removes_temp_file(tmp_path):
+    path = tmp_path / "broken.pdf"
+    path.write_bytes(b"%PDF-1.4\n" + b"garbage " * 100)
+    before = set(glob.glob(os.path.join(tempfile.gettempdir(), "pdf_pages_*")))
+
+    with pytest.raises(Exception):
+        extract_pages_to_store(str(path))
+
+    assert set(glob.glob(os.path.join(tempfile.gettempdir(), "pdf_pages_*"))) == before
@@ -0,0 +1,78 @@
+from core.question_consolidator import MinHashIndex, QuestionConsolidator, split_questions
+
+
+def test_split_questions_removes_block_and_label():
+    body, questions = split_questions(
+        "## Topic\n- point\n\n---\n## Questions\nQ1. What is X?\n**Q2:** Why does Y\nhappen?\n"
+    )
+    assert body == "## Topic\n- point"
+    assert questions == ["What is X?", "Why does Y happen?"]
+
+
+def test_split_questions_strips_level_subheadings():
+    text = (
+        "## Topic\n- point\n\n"
+        "## Review Questions\n### Level 1 (Remember)\nQ1. A?\nQ2. B?\n"
+        "### Level 2 (Understand)\nQ3. C?\nQ4. D?\n"
+    )
+    body, questions = split_questions(text)
+    assert body == "## Topic\n- point"
+    assert questions == ["A?", "B?", "C?", "D?"]
+
+
+def test_split_questions_keeps_content_after_block():
+    body, questions = split_questions("## A\ntext\nQ1. First?\n\n## B\nmore text\n")
+    assert questions == ["First?"]
+    assert body == "## A\ntext\n\n## B\nmore text"
+
+
+def test_quarter_references_are_not_questions():
+    text = "## Results\nQ4 earnings fell sharply.\nQ2 2023 revenue grew.\nMargins were up 3.5%.\n\nQ1. What drove Q4 earnings?\n"
+    body, questions = split_questions(text)
+    assert body == "## Results\nQ4 earnings fell sharply.\nQ2 2023 revenue grew.\nMargins were up 3.5%."
+    assert questions == ["What drove Q4 earnings?"]
+
+
+def test_exact_duplicates_are_merged():
+    index = MinHashIndex()
+    index.add(index.signature("What is photosynthesis?"))
+    assert index.query(index.signature("What is  Photosynthesis ?")) == 0
+
+
+def test_near_miss_questions_are_kept():
+    pairs = [
+        ("Explain why Type I errors occur in hypothesis testing.",
+         "Explain why Type II errors occur in hypothesis testing."),
+        ("Describe the role of the left ventricle in circulation.",
+         "Describe the role of the right ventricle in circulation."),
+    ]
+    for a, b in pairs:
+        index = MinHashIndex()
+        index.add(index.signature(a))
+        assert index.query(index.signature(b)) is None
+
+
+def test_consolidate_renumbers_and_merges_headings():
+    first = "# Biology\n---\n## Cells\n- a\n\n---\n## Questions\nQ1. What is a cell?\nQ2. Name two organelles.\n"
+    second = "# Biology\n---\n## Cells\n- b\n\nQ1. What is a cell?\nQ2. What does the nucleus do?\n"
+    consolidator = QuestionConsolidator()
+    result = consolidator.consolidate([first, second])
+
+    assert result.count("# Biology") == 1
+    assert result.count("## Cells") == 1
+    assert "Q1. What is a cell?\nQ2. Name two organelles.\nQ3. What does the nucleus do?" in result
+    assert consolidator.duplicates == 1
+
+
+def test_numbered_list_questions_are_recognised():
+    text = "## Cells\n- a\n\n## Questions\n1. **Q1:** What organelle makes ATP?\n2. Q2. What does the nucleus store?\n3) Q3) Name a membrane protein.\n"
+    body, questions = split_questions(text)
+    assert body == "## Cells\n- a"
+    assert questions == ["What organelle makes ATP?", "What does the nucleus store?", "Name a membrane protein."]
+
+
+def test_text_after_blank_line_ends_the_block():
+    text = "## Cells\n- a\n\nQ1. What is a\ncell wall?\nQ2. What is a cell membrane?\n\nGood luck studying!\n"
+    body, questions = split_questions(text)
+    assert questions == ["What is a cell wall?", "What is a cell membrane?"]
+    assert body == "## Cells\n- a\n\nGood luck studying!"
@@ -0,0 +1,96 @@
+import time
+import threading
+
+import pytest
+
+from core.scheduler import ChunkScheduler
+
+
+class RecordingClient:
+    # Records call order; blocks until released so the queue can fill up first.
+
+    def __init__(self):
+        self.calls = []
+        self.release = threading.Event()
+
+    def generate_text(self, prompt, **kwargs):
+        self.release.wait()
+        self.calls.append(prompt)
+        return prompt, 10
+
+
+def _queue(scheduler, jobs):
+    # Submit one call per (job, prompt) from its own thread, in order.
+    threads = []
+    for job, prompt in jobs:
+        t = threading.Thread(target=job.generate_text, args=(prompt,))
+        t.start()
+        threads.append(t)
+        while len(scheduler._pending) + (1 if scheduler._running else 0) < len(threads):
+            time.sleep(0.001)
+    return threads
+
+
+def _run(scheduler, client, jobs):
+    # The first queued call is dispatched immediately (blocked in the client);
+    # everything queued after it is ordered by the scheduler.
+    threads = _queue(scheduler, jobs)
+    client.release.set()
+    for t in threads:
+        t.join(timeout=5)
+    return client.calls
+
+
+def test_priority_beats_submission_order():
+    client = RecordingClient()
+    scheduler = ChunkScheduler(client)
+    blocker = scheduler.open_job("u0", "blocker", 100)
+    low = scheduler.open_job("u1", "low", 100, "Low")
+    high = scheduler.open_job("u2", "high", 100, "High")
+
+    calls = _run(scheduler, client, [(blocker, "blocker"), (low, "low"), (high, "high")])
+    assert calls == ["blocker", "high", "low"]
+
+
+def test_shortest_job_first_within_user():
+    client = RecordingClient()
+    scheduler = ChunkScheduler(client)
+    blocker = scheduler.open_job("u0", "blocker", 100)
+    big = scheduler.open_job("u1", "big", 100000)
+    small = scheduler.open_job("u1", "small", 500)
+
+    calls = _run(scheduler, client, [(blocker, "blocker"), (big, "big"), (small, "small")])
+    assert calls == ["blocker", "small", "big"]
+
+
+def test_fair_share_prefers_user_with_less_usage():
+    client = RecordingClient()
+    scheduler = ChunkScheduler(client)
+    scheduler._usage["heavy"] = (50000.0, time.time())
+    blocker = scheduler.open_job("u0", "blocker", 100)
+    heavy = scheduler.open_job("heavy", "heavy", 100)
+    light = scheduler.open_job("light", "light", 100000)
+
+    calls = _run(scheduler, client, [(blocker, "blocker"), (heavy, "heavy"), (light, "light")])
+    assert calls == ["blocker", "light", "heavy"]
+
+
+def test_errors_propagate_and_status_reports_queue():
+    class FailingClient:
+        def generate_text(self, prompt, **kwargs):
+            raise RuntimeError("boom")
+
+    scheduler = ChunkScheduler(FailingClient())
+    with scheduler.open_job("u1", "doc (notes)", 100) as job:
+        with pytest.raises(RuntimeError):
+            job.generate_text("x")
+        status = scheduler.status()
+        assert status["queue_depth"] == 0
+        assert status["wait_samples"] == 1
+        assert status["jobs"][0]["calls_done"] == 1
+    assert scheduler.status()["jobs"] == []
+
+
+def test_unknown_priority_rejected():
+    with pytest.raises(ValueError):
+        ChunkScheduler(RecordingClient()).open_job("u1", "x", 1, "Urgent")
@@ -5,10 +5,13 @@ import gradio as gr
 import os
 from pathlib import Path
 
-from core.pdf_loader import extract_text_from_pdf
+from core.pdf_loader import extract_text_from_pdf, extract_pages_to_store
 from core.groq_client import GroqClient
 from core.markdown_writer import MarkdownWriter
 from core.chunked_processor import TextChunker
+from core.question_consolidator import QuestionConsolidator
+from core.cost_estimator import CostEstimator, SCHEMA_CHARS
+from core.scheduler import ChunkScheduler, PRIORITY_LEVELS
 from prompts.assessment import (
     get_rephrase_clarify_prompt,
     get_schema_prompt,
@@ -19,16 +22,23 @@ from prompts.assessment import (
 class PdfProcessorUI:
     # Gradio UI for PDF-to-Obsidian note generation.
     
+    # Characters of a streamed output file shown in the UI (low-memory mode)
+    PREVIEW_CHARS = 20000
+    
     def __init__(self):
         self.groq = GroqClient()
         self.writer = MarkdownWriter()
+        self.estimator = CostEstimator(self.groq.model, self.groq.history)
+        self.scheduler = ChunkScheduler(self.groq)
         self.current_pdf_text = None
+        self.current_store = None
         self.current_filename = None
     
-    def process_pdf(self, pdf_file):
+    def process_pdf(self, pdf_file, low_memory: bool = False):
         # Extract text from uploaded PDF.
         # Args:
         #     pdf_file: Uploaded PDF file from Gradio.
+        #     low_memory: Spill page text to disk instead of keeping it resident.
         # Returns:
         #     Status message.
 
@@ -36,77 +46,161 @@ class PdfProcessorUI:
             if pdf_file is None:
                 return "No PDF uploaded. Please select a file."
             
-            self.current_pdf_text = extract_text_from_pdf(pdf_file.name)
+            if low_memory:
+                # Queued jobs keep their own reference; the old store is removed once they finish
+                self.current_store = extract_pages_to_store(pdf_file.name)
+                self.current_pdf_text = None
+                text_head = self.current_store.head(501)
+                tokens = self.current_store.estimate_tokens()
+                estimates = self.estimator.estimate_stream(
+                    self.current_store.iter_chunks(),
+                    self.current_store.head(SCHEMA_CHARS)
+                )
+            else:
+                self.current_pdf_text = extract_text_from_pdf(pdf_file.name)
+                self.current_store = None
+                text_head = self.current_pdf_text[:501]
+                tokens = TextChunker.estimate_tokens(self.current_pdf_text)
+                estimates = self.estimator.estimate(self.current_pdf_text)
             self.current_filename = Path(pdf_file.name).stem
             
-            text_preview = self.current_pdf_text[:500] + "..." if len(self.current_pdf_text) > 500 else self.current_pdf_text
-            tokens = TextChunker.estimate_tokens(self.current_pdf_text)
-            return f"✅ PDF processed!\n\nFilename: {self.current_filename}\nTokens: {tokens:,}\n\nPreview:\n{text_preview}"
+            text_preview = text_head[:500] + "..." if len(text_head) > 500 else text_head
+            estimate = self.estimator.format(estimates)
+            mode = "\nMode: low-memory" if low_memory else ""
+            return f"✅ PDF processed!\n\nFilename: {self.current_filename}\nTokens: {tokens:,}{mode}\n\n{estimate}\n\nPreview:\n{text_preview}"
         except Exception as e:
             return f"❌ Error processing PDF: {str(e)}"
     
-    def rephrase_and_clarify(self):
+    def _file_preview(self, filepath: str) -> str:
+        # Leading part of a streamed output file for display.
+        with open(filepath, "r", encoding="utf-8") as f:
+            content = f.read(self.PREVIEW_CHARS + 1)
+        if len(content) > self.PREVIEW_CHARS:
+            content = content[:self.PREVIEW_CHARS] + f"\n\n*… preview truncated, full output in `{filepath}`*"
+        return content
+    
+    def _has_document(self) -> bool:
+        return bool(self.current_pdf_text) or self.current_store is not None
+    
+    @staticmethod
+    def _user_id(request) -> str:
+        # Fair-share identity: logged-in user, else the browser session.
+        if request is None:
+            return "local"
+        return getattr(request, "username", None) or getattr(request, "session_hash", None) or "local"
+    
+    def rephrase_and_clarify(self, priority: str = "Normal", request: gr.Request = None):
         # Generate rephrased notes and schema.
-        if not self.current_pdf_text:
+        if not self._has_document():
             return "❌ Please upload and process a PDF first.", None, None
         
+        # Pin the document: another upload may replace it while this job is queued
+        pdf_text, store, filename = self.current_pdf_text, self.current_store, self.current_filename
+        
         try:
+            job = self.scheduler.open_job(
+                self._user_id(request),
+                f"{filename} (notes)",
+                store.estimate_tokens() if store else TextChunker.estimate_tokens(pdf_text),
+                priority
+            )
+            
             def process_chunk(chunk: str, chunk_num: int) -> tuple:
                 # Process one chunk.
                 prompt = get_rephrase_clarify_prompt(chunk)
-                result, tokens = self.groq.generate_text(prompt)
+                result, tokens = job.generate_text(prompt, kind="notes")
                 return result, tokens
             
-            # Process in chunks serially
-            notes_content, stats = TextChunker.process_serial(
-                self.current_pdf_text, 
-                process_chunk,
-                show_progress=True
-            )
-            
-            # Save notes
-            notes_filename = f"{self.current_filename}_notes"
-            notes_path = self.writer.save_file(notes_filename, notes_content)
-            
-            # Generate schema on full text (smaller)
-            schema_prompt = get_schema_prompt(self.current_pdf_text[:8000])
-            schema_content, _ = self.groq.generate_text(schema_prompt)
+            with job:
+                # Process in chunks serially, merging the per-chunk question sets locally
+                consolidator = QuestionConsolidator()
+                notes_filename = f"{filename}_notes"
+                
+                if store is not None:
+                    schema_source = store.head(SCHEMA_CHARS)
+                    
+                    # Low-memory: stream chunk bodies straight to disk, keep only the questions
+                    with self.writer.open_stream(notes_filename) as (notes_path, notes_file):
+                        def write_chunk(result: str):
+                            body = consolidator.add(result)
+                            if body:
+                                notes_file.write(body + "\n\n")
+                        
+                        stats = TextChunker.process_stream(store.iter_chunks(), process_chunk, write_chunk)
+                        notes_file.write(consolidator.render_questions())
+                    
+                    notes_content = self._file_preview(notes_path)
+                else:
+                    notes_content, stats = TextChunker.process_serial(
+                        pdf_text, 
+                        process_chunk,
+                        show_progress=True,
+                        combine_fn=consolidator.consolidate
+                    )
+                    
+                    # Save notes
+                    notes_path = self.writer.save_file(notes_filename, notes_content)
+                    schema_source = pdf_text[:SCHEMA_CHARS]
+                
+                # Generate schema on full text (smaller)
+                schema_prompt = get_schema_prompt(schema_source)
+                schema_content, _ = job.generate_text(schema_prompt, kind="schema")
             
             # Save schema
-            schema_filename = f"{self.current_filename}_schema"
+            schema_filename = f"{filename}_schema"
             schema_path = self.writer.save_file(schema_filename, schema_content)
             
-            status_msg = f"✅ Generated:\n- {os.path.basename(notes_path)}\n- {os.path.basename(schema_path)}"
+            status_msg = (
+                f"✅ Generated:\n- {os.path.basename(notes_path)}\n- {os.path.basename(schema_path)}"
+                f"\n\nQuestions: {len(consolidator.questions)} ({consolidator.duplicates} duplicates removed)"
+            )
             return status_msg, notes_content, schema_content
         
         except Exception as e:
             return f"❌ Error: {str(e)}", None, None
     
-    def generate_assessment(self, bloom_level):
+    def generate_assessment(self, bloom_level, priority: str = "Normal", request: gr.Request = None):
         # Generate assessment questions based on Bloom's level.
         if bloom_level == "None":
             return "ℹ️ Assessment disabled. Select a Bloom's Taxonomy level.", None
         
-        if not self.current_pdf_text:
+        if not self._has_document():
             return "❌ Please upload and process a PDF first.", None
         
+        pdf_text, store, filename = self.current_pdf_text, self.current_store, self.current_filename
+        
         try:
+            job = self.scheduler.open_job(
+                self._user_id(request),
+                f"{filename} (assessment)",
+                store.estimate_tokens() if store else TextChunker.estimate_tokens(pdf_text),
+                priority
+            )
+            
             def process_chunk(chunk: str, chunk_num: int) -> tuple:
                 # Process one chunk.
                 prompt = get_assessment_prompt(chunk, bloom_level)
-                result, tokens = self.groq.generate_text(prompt)
+                result, tokens = job.generate_text(prompt, kind="assessment")
                 return result, tokens
             
-            # Process in chunks serially with rate limiting
-            assessment_content, stats = TextChunker.process_serial(
-                self.current_pdf_text,
-                process_chunk,
-                show_progress=True
-            )
+            assessment_filename = f"{filename}_assessment_{bloom_level.replace(' ', '_').lower()}"
             
-            # Save assessment
-            assessment_filename = f"{self.current_filename}_assessment_{bloom_level.replace(' ', '_').lower()}"
-            assessment_path = self.writer.save_file(assessment_filename, assessment_content)
+            # Process in chunks serially through the shared scheduler
+            with job:
+                if store is not None:
+                    # Low-memory: results go straight to the output file
+                    with self.writer.open_stream(assessment_filename) as (assessment_path, assessment_file):
+                        stats = TextChunker.process_stream(store.iter_chunks(), process_chunk, assessment_file.write)
+                    assessment_content = self._file_preview(assessment_path)
+                else:
+                    assessment_content, stats = TextChunker.process_serial(
+                        pdf_text,
+                        process_chunk,
+                        show_progress=True
+                    )
+                    
+                    # Save assessment
+                    assessment_path = self.writer.save_file(assessment_filename, assessment_content)
             
             status_msg = f"✅ Generated: {os.path.basename(assessment_path)}"
             return status_msg, assessment_content
@@ -116,9 +210,15 @@ class PdfProcessorUI:
     
     def clear_workspace(self):
         self.writer.clear_outputs()
+        # Only drop the reference: queued jobs may still hold the store, and its
+        # temp file is removed once the last of them releases it
         self.current_pdf_text = None
+        self.current_store = None
         self.current_filename = None
         return "✅ Workspace cleared."
+    
+    def queue_status(self):
+        return self.scheduler.format_status()
 
 
 def create_ui():
@@ -136,21 +236,30 @@ def create_ui():
         with gr.Row():
             with gr.Column(scale=2):
                 pdf_input = gr.File(label="📄 Upload PDF", file_types=[".pdf"])
+                low_memory = gr.Checkbox(label="🪶 Low-memory mode (very large PDFs)", value=False)
                 process_btn = gr.Button("📥 Process PDF", variant="primary")
             
             with gr.Column(scale=1):
-                pdf_status = gr.Textbox(label="Status", interactive=False, lines=5)
+                pdf_status = gr.Textbox(label="Status", interactive=False, lines=10)
         
         # Process PDF callback
         process_btn.click(
             fn=processor.process_pdf,
-            inputs=[pdf_input],
+            inputs=[pdf_input, low_memory],
             outputs=[pdf_status]
         )
         
         # Notes & Schema Generation
         with gr.Row():
-            notes_btn = gr.Button("✍️ Rephrase & Clarify", variant="primary", size="lg")
+            with gr.Column(scale=2):
+                notes_btn = gr.Button("✍️ Rephrase & Clarify", variant="primary", size="lg")
+            
+            with gr.Column(scale=1):
+                priority = gr.Radio(
+                    choices=list(PRIORITY_LEVELS),
+                    value="Normal",
+                    label="⏱️ Job Priority"
+                )
         
         with gr.Row():
             with gr.Column():
@@ -161,11 +270,12 @@ def create_ui():
                 gr.Markdown("### 📊 Schema")
                 schema_output = gr.Markdown(label="Schema Content")
         
-        # Generate notes callback
+        # Generate notes callback (concurrent; the scheduler orders the API calls)
         notes_btn.click(
             fn=processor.rephrase_and_clarify,
-            inputs=[],
-            outputs=[pdf_status, notes_output, schema_output]
+            inputs=[priority],
+            outputs=[pdf_status, notes_output, schema_output],
+            concurrency_limit=None
         )
         
         # Assessment Questions
@@ -187,8 +297,23 @@ def create_ui():
         # Generate assessment callback
         assessment_btn.click(
             fn=processor.generate_assessment,
-            inputs=[bloom_level],
-            outputs=[pdf_status, assessment_output]
+            inputs=[bloom_level, priority],
+            outputs=[pdf_status, assessment_output],
+            concurrency_limit=None
+        )
+        
+        # Scheduler queue
+        with gr.Row():
+            with gr.Column(scale=2):
+                queue_output = gr.Textbox(label="📋 Queue", interactive=False, lines=5)
+            
+            with gr.Column(scale=1):
+                queue_btn = gr.Button("🔄 Refresh Queue", variant="secondary")
+        
+        queue_btn.click(
+            fn=processor.queue_status,
+            inputs=[],
+            outputs=[queue_output]
         )
         
         # Configuration display